@@ -19,7 +19,7 @@ from abaqus import *
 from abaqusConstants import *
 import mesh
 import regionToolset
-from typing import List
+from typing import List, Optional
 
 
 # Define main directories
@@ -28,22 +28,45 @@ OUTPUTS_DIR = os.path.join(PROJ_ROOT, "outputs")
 TEMP_DIR = os.path.join(PROJ_ROOT, "temp")
 
 
+def case_file_from_argv(argv: List[str]) -> Optional[str]:
+    """
+    Return the case file passed after "--" on the command line, if any.
+
+    run_study.py launches one Abaqus process per case with
+    ``abaqus cae noGUI=main.py -- <case_file>``.
+    """
+    if "--" in argv:
+        args = argv[argv.index("--") + 1 :]
+        if args:
+            return os.path.abspath(args[0])
+    return None
+
+
 if __name__ == "__main__":
     for dir_path in [OUTPUTS_DIR, TEMP_DIR]:
         create_directory(dir_path)
 
-    study_path = os.path.join(INPUTS_DIR, "study.json")
-    case_path = os.path.join(TEMP_DIR, "cases")
-    case_files, job_names = split_study_into_cases(study_path, case_path, "20250505")
+    case_file = case_file_from_argv(sys.argv)
+    if case_file is None:
+        # Stand-alone run: split the study and build the first case
+        study_path = os.path.join(INPUTS_DIR, "study.json")
+        case_path = os.path.join(TEMP_DIR, "cases")
+        case_files, job_names = split_study_into_cases(
+            study_path, case_path, "20250505"
+        )
+        case_file = case_files[0]
 
-    case_file = case_files[0]
     cfg, sim_cfg = from_case_to_configs(case_file)
 
-    init_logger(OUTPUTS_DIR)
+    # Each case works in its own directory so parallel runs do not collide
+    case_dir = os.path.join(TEMP_DIR, cfg.job_name())
+    create_directory(case_dir)
+
+    init_logger(OUTPUTS_DIR, "log_%s.txt" % cfg.job_name())
 
-    os.chdir(TEMP_DIR)
+    os.chdir(case_dir)
 
     mdb.close()
     model = mdb.Model(name="Model-1")
-    build_model_and_job(sim_config=sim_cfg, cfg=cfg, model=model, TEMP_DIR=TEMP_DIR)
+    build_model_and_job(sim_config=sim_cfg, cfg=cfg, model=model, TEMP_DIR=case_dir)
     close_logger()
@@ -0,0 +1,117 @@
+"""
+Run every case of a parametric study in parallel.
+
+Splits inputs/study.json into case files once, then launches one
+``abaqus cae noGUI=main.py -- <case_file>`` process per case. Cases are
+independent, so up to ``max_parallel_jobs`` of them run at the same time,
+limited by the CPUs available for ``num_cpus`` per job (both set in the
+"simulation" section of study.json).
+
+Usage:
+    python run_study.py [max_parallel_jobs]
+"""
+
+import os
+import sys
+import shutil
+import inspect
+import subprocess
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Set up project root and paths
+_THIS = inspect.getfile(inspect.currentframe())
+PROJ_ROOT = os.path.abspath(os.path.dirname(_THIS))
+if PROJ_ROOT not in sys.path:
+    sys.path.insert(0, PROJ_ROOT)
+
+from src.study_generator.generator import (
+    load_simulation_config,
+    split_study_into_cases,
+)
+from src.study_generator.model_input import SimulationConfig
+from src.utils.utils import create_directory
+
+
+# Define main directories
+INPUTS_DIR = os.path.join(PROJ_ROOT, "inputs")
+TEMP_DIR = os.path.join(PROJ_ROOT, "temp")
+MAIN_SCRIPT = os.path.join(PROJ_ROOT, "main.py")
+ABAQUS_CMD = shutil.which("abaqus")
+
+
+def run_case(case_file: str, job_name: str) -> int:
+    """
+    Build and run a single case in its own Abaqus CAE process.
+
+    The process starts in the case directory TEMP_DIR/<job_name>, so the
+    abaqus.rpy/.rec files that CAE writes there do not collide between cases.
+
+    Args:
+        case_file: Path to the case JSON file
+        job_name: Job name of the case
+
+    Returns:
+        Exit code of the Abaqus process
+    """
+    case_dir = os.path.join(TEMP_DIR, job_name)
+    create_directory(case_dir)
+    cmd = [ABAQUS_CMD, "cae", "noGUI=%s" % MAIN_SCRIPT, "--", case_file]
+    return subprocess.run(cmd, cwd=case_dir).returncode
+
+
+def max_concurrent_jobs(sim_cfg: SimulationConfig, max_parallel_jobs: int) -> int:
+    """
+    Number of cases that may run at once without oversubscribing the CPUs.
+
+    Args:
+        sim_cfg: Simulation configuration with num_cpus per job
+        max_parallel_jobs: Requested number of concurrent cases
+
+    Returns:
+        Number of concurrent cases (at least 1)
+    """
+    cpu_budget = os.cpu_count() or 1
+    return max(1, min(max_parallel_jobs, cpu_budget // sim_cfg.num_cpus))
+
+
+def run_study(
+    case_files: list[str],
+    job_names: list[str],
+    sim_cfg: SimulationConfig,
+    max_parallel_jobs: Optional[int] = None,
+) -> list[int]:
+    """
+    Run all cases, solving several of them at the same time.
+
+    Args:
+        case_files: Paths to the case JSON files
+        job_names: Job names of the cases, in the order of case_files
+        sim_cfg: Simulation configuration (max_parallel_jobs, num_cpus)
+        max_parallel_jobs: Overrides sim_cfg.max_parallel_jobs if given
+
+    Returns:
+        Exit codes, in the order of case_files
+    """
+    if max_parallel_jobs is None:
+        max_parallel_jobs = sim_cfg.max_parallel_jobs
+    max_workers = max_concurrent_jobs(sim_cfg, max_parallel_jobs)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(run_case, case_files, job_names))
+
+
+if __name__ == "__main__":
+    max_parallel_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    if ABAQUS_CMD is None:
+        sys.exit("Abaqus launcher not found on PATH.")
+
+    create_directory(TEMP_DIR)
+    study_path = os.path.join(INPUTS_DIR, "study.json")
+    case_path = os.path.join(TEMP_DIR, "cases")
+    case_files, job_names = split_study_into_cases(study_path, case_path, "20250505")
+    sim_cfg = load_simulation_config(study_path)
+
+    codes = run_study(case_files, job_names, sim_cfg, max_parallel_jobs)
+    for job_name, code in zip(job_names, codes):
+        print("%s: %s" % (job_name, "OK" if code == 0 else "exit code %d" % code))
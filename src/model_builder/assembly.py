@@ -2,7 +2,7 @@
 Assembly operations for composite impact simulations.
 
 Handles:
-- Layer stacking and merging
+- Layer stacking
 - Instance creation and positioning
 - Tie constraints between refined and coarse regions
 - Datum coordinate systems
@@ -22,97 +22,34 @@ if TYPE_CHECKING:
     from abaqus.Assembly.Assembly import Assembly
     from abaqus.Assembly.PartInstance import PartInstance
 
-from src.model_builder.geometry import StackLayer
+from src.model_builder.geometry import LayerStack
+from src.model_builder.probes import ProbeCoordinates, find_at
 from src.study_generator.model_input import ModelInput
 from src.model_builder.boundary_conditions import create_rigid_body_and_mass
 
 
-def merge_laminate_stack(
-    asm: "Assembly",
-    stack_layers: List[StackLayer],
-    part_ply: "Part",
-    prefix: str = "I",
-) -> None:
-    """
-    Create and merge instances of plies and cohesive layers into a laminate.
-
-    Args:
-        asm: Abaqus Assembly object
-        stack_layers: List of StackLayer objects defining the stack
-        part_ply: Template part for plies
-        part_coh: Template part for cohesive layers
-        prefix: Prefix for instance names (default "I" for refined, "IC" for coarse)
-
-    Creates a merged part named "Laminate" or "Laminate_Course"
-    """
-    to_merge = []
-    for i, layer in enumerate(stack_layers):
-        base = part_ply
-        iname = "%s_%s_%02d" % (prefix, "Ply", i)
-        inst = asm.Instance(name=iname, part=base, dependent=ON)
-        asm.translate(instanceList=(iname,), vector=(0.0, 0.0, layer.z_bot))
-        to_merge.append(inst)
-
-    merge_name = "Laminate_Course"
-    asm.InstanceFromBooleanMerge(
-        name=merge_name,
-        instances=tuple(to_merge),
-        keepIntersections=ON,
-        originalInstances=DELETE,
-        domain=GEOMETRY,
-    )
-
-
-def add_datum_coordinate_system(part: "Part") -> None:
-    """
-    Add a datum coordinate system to a part at the origin.
-
-    Args:
-        part: Part object to add datum to
-    """
-    part.DatumCsysByThreePoints(
-        name="SYS",
-        coordSysType=CARTESIAN,
-        origin=(0.0, 0.0, 0.0),
-        line1=(1.0, 0.0, 0.0),
-        line2=(0.0, 1.0, 0.0),
-    )
-
-
 def create_tie_faces(
     lam_instances: List["PartInstance"],
     lam_course_inst: "PartInstance",
-    stack_layers: List[StackLayer],
-    plate_W: float,
-    plate_L: float,
+    probe_coords: ProbeCoordinates,
 ) -> Tuple[List, List]:
     """
     Identify faces at the interface between refined and coarse regions for tie constraint.
 
     Args:
-        lam_inst: Refined laminate instance
+        lam_instances: Refined ply instances (one per layer)
         lam_course_inst: Coarse laminate instance
-        stack_layers: List of StackLayer objects
-        plate_W: Plate width in mm
-        plate_L: Plate length in mm
+        probe_coords: Precomputed findAt probe points
 
     Returns:
         Tuple of (tie_faces1, tie_faces2) for refined and coarse regions
     """
-    tie_faces1 = []
-    tie_faces2 = []
-
-    for i, layer in enumerate(stack_layers):
-        z_mid = layer.z_mid
-        connecting_pos = [
-            (plate_W / 2, 0.0, z_mid),
-            (0.0, plate_L / 2, z_mid),
-            (-plate_W / 2, 0.0, z_mid),
-            (0.0, -plate_L / 2, z_mid),
-        ]
-        for pos in connecting_pos:
-            tie_faces1.append(lam_instances[i].faces.findAt((pos,)))
-            tie_faces2.append(lam_course_inst.faces.findAt((pos,)))
+    # One findAt per refined instance, one for the whole coarse instance
+    tie_faces1 = [
+        find_at(inst, points)
+        for inst, points in zip(lam_instances, probe_coords.tie_refined)
+    ]
+    tie_faces2 = [find_at(lam_course_inst, probe_coords.tie_coarse)]
 
     return tie_faces1, tie_faces2
 
@@ -176,7 +113,7 @@ def position_impactor(
 
 def create_laminate_stack(
     asm: "Assembly",
-    stack_layers: List[StackLayer],
+    stack_layers: LayerStack,
     unique_plies: dict["float", "Part"],
 ) -> List["PartInstance"]:
     """
@@ -184,71 +121,77 @@ def create_laminate_stack(
 
     Args:
         asm: Abaqus Assembly object
-        stack_layers: List of StackLayer objects defining the stack
-        cfg: ModelInput configuration object
+        stack_layers: LayerStack defining the stack
+        unique_plies: Refined ply parts keyed by ply angle
+
+    Returns:
+        List of ply instances, bottom to top
     """
-    # Create the laminate assembly by instancing and translating each layer part
+    # Create all ply instances first; they are positioned below in a few batches
+    inames = tuple("IC_Ply_%02d" % i for i in range(len(stack_layers)))
     instances = []
-    for i, layer in enumerate(stack_layers):
-        # Check angle and get correct part
-        if layer.ang == 0.0:
-            base = unique_plies[0.0]
-            iname = "IC_Ply_%02d" % (i)
-        elif layer.ang == 45.0:
-            base = unique_plies[45.0]
-            iname = "IC_Ply_%02d" % (i)
-        elif layer.ang == -45.0:
-            base = unique_plies[-45.0]
-            iname = "IC_Ply_%02d" % (i)
-        elif layer.ang == 90.0:
-            base = unique_plies[90.0]
-            iname = "IC_Ply_%02d" % (i)
+    for iname, ang in zip(inames, stack_layers.ang):
+        # Plies are keyed by angle in unique_plies, so look the part up directly
+        base = unique_plies[ang]
         instances.append(asm.Instance(name=iname, part=base, dependent=ON))
-        asm.translate(instanceList=(iname,), vector=(0.0, 0.0, layer.z_bot))
+
+    # Ply i sits at z_bot = i * ply_thk. Translations add up, so shifting every
+    # ply whose index has bit b set by 2**b plies positions the whole stack
+    # with ceil(log2(N)) translate calls instead of one call per ply
+    ply_thk = stack_layers.thk[0]
+    bit = 1
+    while bit < len(inames):
+        batch = tuple(iname for i, iname in enumerate(inames) if i & bit)
+        asm.translate(instanceList=batch, vector=(0.0, 0.0, bit * ply_thk))
+        bit <<= 1
 
     return instances
 
 
 def assemble_model(
-    model: "Model", asm: "Assembly", parts, stack_layers, cfg: ModelInput
+    model: "Model",
+    asm: "Assembly",
+    parts,
+    stack_layers: LayerStack,
+    cfg: ModelInput,
+    probe_coords: ProbeCoordinates,
 ) -> Tuple:
     """
-    Assemble the model by merging laminate stacks and preparing instances.
+    Assemble the model by instancing the laminate parts and the impactor.
 
     Args:
         model: Abaqus Model object
         asm: Abaqus Assembly object
         parts: Tuple of created Part objects
-        stack_layers: List of StackLayer objects defining the stack
+        stack_layers: LayerStack defining the stack
         cfg: ModelInput configuration object
+        probe_coords: Precomputed findAt probe points
 
     Returns:
-        Tuple of merged parts and instantiated parts
+        Tuple of laminate/impactor parts and instantiated parts
     """
     part_ply, part_ply_course, part_impactor = parts
 
     asm.DatumCsysByDefault(CARTESIAN)
 
-    merge_laminate_stack(asm, stack_layers, part_ply_course, prefix="IC")
-    lam_course_part = model.parts["Laminate_Course"]
-    add_datum_coordinate_system(lam_course_part)
-    lam_course_inst = asm.instances["Laminate_Course-1"]
+    lam_course_part = part_ply_course
+    lam_course_inst = asm.Instance(
+        name="Laminate_Course-1", part=lam_course_part, dependent=ON
+    )
 
     lam_instances = create_laminate_stack(asm, stack_layers, part_ply)
 
     create_tie_constraint(
         model,
         asm,
-        *create_tie_faces(
-            lam_instances, lam_course_inst, stack_layers, cfg.width, cfg.length
-        ),
+        *create_tie_faces(lam_instances, lam_course_inst, probe_coords),
     )
 
     # ---------------------- Position impactor ----------------------
     rp_id = position_impactor(asm, part_impactor, cfg.plate_T, cfg.imp_radius)
-    create_rigid_body_and_mass(model, asm, rp_id, cfg)
-
     imp_inst = asm.instances["Impactor"]
+    create_rigid_body_and_mass(model, asm, imp_inst, rp_id, cfg)
+
     return (
         (part_ply, lam_course_part, part_impactor),
         (lam_instances, lam_course_inst, imp_inst),
@@ -8,7 +8,7 @@ Handles:
 - Reference point constraints
 """
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING
 
 from abaqus import *
 from abaqusConstants import *
@@ -19,54 +19,29 @@ if TYPE_CHECKING:
     from abaqus.Assembly.Assembly import Assembly
     from abaqus.Assembly.PartInstance import PartInstance
 
-from src.model_builder.geometry import StackLayer
+from src.model_builder.probes import ProbeCoordinates, find_at
 from src.study_generator.model_input import ModelInput
 
 
 def apply_plate_boundary_conditions(
     model: "Model",
     lam_course_inst: "PartInstance",
-    stack_layers: List[StackLayer],
-    plate_W: float,
-    plate_L: float,
-    S: float,
+    probe_coords: ProbeCoordinates,
 ) -> None:
     """
     Apply clamped short edges and simply-supported long edges to the plate.
 
     Args:
         model: Abaqus Model object
-        lam_inst: Refined laminate instance
-        lam_course_inst: Coarse laminate instance (can be None)
-        stack_layers: List of StackLayer objects
-        plate_W: Plate width in mm
-        plate_L: Plate length in mm
-        S: Scale factor for coarse region
-        use_coarse: Whether to apply BCs to coarse region
+        lam_course_inst: Coarse laminate instance
+        probe_coords: Precomputed findAt probe points
     """
 
-    # Clamp short edges (±X faces at all z)
-    clamped_faces = lam_course_inst.faces.findAt(
-        ((S * plate_W / 2.0, 0.0, stack_layers[0].z_mid),)
-    )
-    clamped_faces += lam_course_inst.faces.findAt(
-        ((-S * plate_W / 2.0, 0.0, stack_layers[0].z_mid),)
-    )
-    for layer in stack_layers[1:]:
-        clamped_faces += lam_course_inst.faces.findAt(
-            ((S * plate_W / 2.0, 0.0, layer.z_mid),)
-        )
-        clamped_faces += lam_course_inst.faces.findAt(
-            ((-S * plate_W / 2.0, 0.0, layer.z_mid),)
-        )
+    # Clamp short edges (±X faces at all z), probed with a single findAt
+    clamped_faces = find_at(lam_course_inst, probe_coords.clamp)
 
     # Simply supported long edges (±Y edges at z=bottom)
-    long_edges = lam_course_inst.edges.findAt(
-        ((0.0, S * plate_L / 2.0, stack_layers[0].z_bot),)
-    )
-    long_edges += lam_course_inst.edges.findAt(
-        ((0.0, -S * plate_L / 2.0, stack_layers[0].z_bot),)
-    )
+    long_edges = find_at(lam_course_inst, probe_coords.support, kind="edges")
 
     # Apply boundary conditions
     model.DisplacementBC(
@@ -88,7 +63,11 @@ def apply_plate_boundary_conditions(
 
 
 def create_rigid_body_and_mass(
-    model: "Model", asm: "Assembly", rp_id: int, cfg: ModelInput
+    model: "Model",
+    asm: "Assembly",
+    imp_inst: "PartInstance",
+    rp_id: int,
+    cfg: ModelInput,
 ) -> None:
     """
     Create rigid body definition and assign point mass to impactor.
@@ -96,11 +75,11 @@ def create_rigid_body_and_mass(
     Args:
         model: Abaqus Model object
         asm: Assembly object
+        imp_inst: Impactor instance
         rp_id: Reference point ID
         cfg: ModelInput object containing impactor properties
     """
-    imp_faces = asm.instances["Impactor"].faces
-    set_imp = asm.Set(faces=imp_faces, name="Set-Impactor")
+    set_imp = asm.Set(faces=imp_inst.faces, name="Set-Impactor")
     rp_region = regionToolset.Region(referencePoints=(asm.referencePoints[rp_id],))
 
     model.RigidBody(name="Impactor_RB", refPointRegion=rp_region, bodyRegion=set_imp)
@@ -17,6 +17,7 @@ from src.model_builder.materials import (
 from src.model_builder.assembly import assemble_model
 
 from src.model_builder.mesh import seed_and_mesh_model
+from src.model_builder.probes import ProbeCoordinates
 
 from src.model_builder.preprocessing import assign_sections_and_orientations
 from src.model_builder.boundary_conditions import (
@@ -71,13 +72,18 @@ def build_model_and_job(
     # ---------------------- Calculate layer stack ----------------------
     stack_layers = calculate_layer_stack(cfg.ply_angles, cfg.ply_thk, cfg.coh_thk)
 
+    # findAt probe points shared by tie, contact and boundary condition setup
+    probe_coords = ProbeCoordinates.from_stack(
+        stack_layers, cfg.width, cfg.length, sim_config.coarse_scale
+    )
+
     # ---------------------- Assembly ----------------------
     asm = model.rootAssembly
 
     (
         (lam_parts, lam_course_part, imp_part),
         (lam_instances, lam_course_inst, imp_inst),
-    ) = assemble_model(model, asm, parts, stack_layers, cfg)
+    ) = assemble_model(model, asm, parts, stack_layers, cfg, probe_coords)
 
     for part in lam_parts:
         print("Seeding and meshing part: %s" % part)
@@ -103,20 +109,13 @@ def build_model_and_job(
     )
     #
     # ---------------------- Contact ----------------------
-    create_contacts(model, asm, lam_instances, imp_inst, cfg, stack_layers)
+    create_contacts(model, asm, lam_instances, imp_inst, cfg, probe_coords)
     #
     ## ---------------------- Step ----------------------
     create_explicit_step(model, sim_config.time)
     #
     ## ---------------------- Boundary conditions ----------------------
-    apply_plate_boundary_conditions(
-        model,
-        lam_course_inst,
-        stack_layers,
-        cfg.width,
-        cfg.length,
-        sim_config.coarse_scale,
-    )
+    apply_plate_boundary_conditions(model, lam_course_inst, probe_coords)
     #
     ## ---------------------- Output requests ----------------------
     configure_field_outputs(
@@ -128,7 +127,7 @@ def build_model_and_job(
     ## ---------------------- Print model report ----------------------
     print_model_report(
         cfg,
-        lam_parts[0.0],
+        next(iter(lam_parts.values())),
         imp_part,
         lam_course_part,
         sim_config.mesh_coarse,
@@ -146,4 +145,6 @@ def build_model_and_job(
         model_name="Model-1",
         wait=True,
         TEMP_DIR=TEMP_DIR,
+        num_cpus=sim_config.num_cpus,
+        num_domains=sim_config.num_domains,
     )
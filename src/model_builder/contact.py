@@ -19,7 +19,11 @@ if TYPE_CHECKING:
     from abaqus.Assembly.PartInstance import PartInstance
 
 from src.study_generator.model_input import ModelInput
-from src.model_builder.geometry import StackLayer
+from src.model_builder.probes import (
+    ProbeCoordinates,
+    find_at,
+    split_faces_by_z,
+)
 
 
 def create_general_contact(model: "Model", cfg: "ModelInput") -> None:
@@ -29,22 +33,17 @@ def create_general_contact(model: "Model", cfg: "ModelInput") -> None:
     Args:
         model: Abaqus Model object
     """
-    model.ContactProperty("GeneralContactProp")
-    model.interactionProperties["GeneralContactProp"].TangentialBehavior(
-        formulation=FRICTIONLESS
-    )
-    model.interactionProperties["GeneralContactProp"].NormalBehavior(
+    gc_prop = model.ContactProperty("GeneralContactProp")
+    gc_prop.TangentialBehavior(formulation=FRICTIONLESS)
+    gc_prop.NormalBehavior(
         pressureOverclosure=HARD,
         allowSeparation=ON,
         constraintEnforcementMethod=DEFAULT,
     )
 
-    model.ContactExp(name="General_Contact", createStepName="Initial")
-    model.interactions["General_Contact"].includedPairs.setValuesInStep(
-        stepName="Initial", useAllstar=ON
-    )
-
-    model.interactions["General_Contact"].contactPropertyAssignments.appendInStep(
+    gc = model.ContactExp(name="General_Contact", createStepName="Initial")
+    gc.includedPairs.setValuesInStep(stepName="Initial", useAllstar=ON)
+    gc.contactPropertyAssignments.appendInStep(
         stepName="Initial", assignments=((GLOBAL, SELF, "GeneralContactProp"),)
     )
 
@@ -54,7 +53,7 @@ def create_cohesive_layer_contact(
     asm: "Assembly",
     lam_instances: List["PartInstance"],
     cfg: "ModelInput",
-    stack_layers: List[StackLayer],
+    probe_coords: ProbeCoordinates,
 ) -> None:
     """
     Create cohesive contact between plies
@@ -62,19 +61,22 @@ def create_cohesive_layer_contact(
     Args:
         model: Abaqus Model object
         asm: Assembly object
-        coh_inst: Cohesive layer part instance
+        lam_instances: Refined ply instances (one per layer)
+        cfg: ModelInput configuration object
+        probe_coords: Precomputed findAt probe points
     """
 
     mat = cfg.material
 
-    model.ContactProperty("Cohesive_contact")
-    model.interactionProperties["Cohesive_contact"].CohesiveBehavior(
+    coh_prop = model.ContactProperty("Cohesive_contact")
+
+    coh_prop.CohesiveBehavior(
         defaultPenalties=OFF,
         table=(
             (mat.En / 0.1, mat.G1 / 0.1, mat.G2 / 0.1),
         ),  # Penalty stiffnesses Kn Kt Kb (Divided by thickness)
     )
-    model.interactionProperties["Cohesive_contact"].Damage(
+    coh_prop.Damage(
         criterion=QUAD_TRACTION,
         initTable=((mat.N, mat.S1, mat.S2),),  # These are the peak strengths
         useEvolution=ON,
@@ -86,28 +88,44 @@ def create_cohesive_layer_contact(
         viscosityCoef=1.0,
     )
 
-    model.interactionProperties["Cohesive_contact"].NormalBehavior(
+    coh_prop.NormalBehavior(
         pressureOverclosure=HARD,
         allowSeparation=ON,
         constraintEnforcementMethod=DEFAULT,
     )
 
-    for i, layer in enumerate(stack_layers):
-        z_top = layer.z_top
-
-        # Between every ply except the top one
-        if i != len(stack_layers) - 1:
-            top_face_i = lam_instances[i].faces.findAt(((0.0, 0.0, z_top),))
-            bottom_face_ip1 = lam_instances[i + 1].faces.findAt(((0.0, 0.0, z_top),))
-
-            top_i = asm.Surface(name="Cohesive_Top_%d" % i, side1Faces=top_face_i)
-            bottom_ip1 = asm.Surface(
-                name="Cohesive_Bottom_%d" % (i + 1), side1Faces=bottom_face_ip1
-            )
+    interfaces = probe_coords.interfaces
+    n_interfaces = len(interfaces)
+
+    # Interface k lies between the top face of ply k and the bottom face of
+    # ply k + 1. Probe each ply once for all of its interfaces, then split the
+    # batched result back into one face per interface.
+    top_faces = [None] * n_interfaces
+    bottom_faces = [None] * n_interfaces
+    for i, inst in enumerate(lam_instances):
+        ks = range(max(i - 1, 0), min(i + 1, n_interfaces))
+        if not ks:
+            continue
+        z_probe = [interfaces[k] for k in ks]
+        found = find_at(inst, [(0.0, 0.0, z) for z in z_probe])
+        for k, faces in zip(ks, split_faces_by_z(found, z_probe)):
+            if k == i:
+                top_faces[k] = faces
+            else:
+                bottom_faces[k] = faces
+
+    coh_assignments = []
+    for k, (top_face, bottom_face) in enumerate(zip(top_faces, bottom_faces)):
+        top_k = asm.Surface(name="Cohesive_Top_%d" % k, side1Faces=top_face)
+        bottom_k = asm.Surface(
+            name="Cohesive_Bottom_%d" % (k + 1), side1Faces=bottom_face
+        )
+        coh_assignments.append((top_k, bottom_k, "Cohesive_contact"))
 
+    # Assign all interfaces with a single call
+    if coh_assignments:
         model.interactions["General_Contact"].contactPropertyAssignments.appendInStep(
-            stepName="Initial",
-            assignments=((top_i, bottom_ip1, "Cohesive_contact"),),
+            stepName="Initial", assignments=tuple(coh_assignments)
         )
 
 
@@ -130,15 +148,15 @@ def create_impactor_contact(
         plate_T: Total plate thickness in mm
         friction_coeff: Friction coefficient (default 0.3)
     """
-    model.ContactProperty("Impactor_Laminate_CP")
-    model.interactionProperties["Impactor_Laminate_CP"].TangentialBehavior(
+    imp_prop = model.ContactProperty("Impactor_Laminate_CP")
+    imp_prop.TangentialBehavior(
         formulation=PENALTY,
         directionality=ISOTROPIC,
         table=((friction_coeff,),),
         maximumElasticSlip=FRACTION,
         fraction=0.005,
     )
-    model.interactionProperties["Impactor_Laminate_CP"].NormalBehavior(
+    imp_prop.NormalBehavior(
         pressureOverclosure=HARD,
         allowSeparation=ON,
         constraintEnforcementMethod=DEFAULT,
@@ -146,7 +164,7 @@ def create_impactor_contact(
 
     # Create surfaces
     imp_surf = asm.Surface(name="Surf_Impactor", side1Faces=imp_inst.faces)
-    lam_top_faces = lam_inst.faces.findAt(((0.0, 0.0, plate_T),))
+    lam_top_faces = find_at(lam_inst, [(0.0, 0.0, plate_T)])
     lam_surface = asm.Surface(name="Surf_LamTop", side1Faces=lam_top_faces)
 
     # Assign contact property
@@ -162,7 +180,7 @@ def create_contacts(
     lam_instances: List["PartInstance"],
     imp_inst: "PartInstance",
     cfg: "ModelInput",
-    stack_layers: List[StackLayer],
+    probe_coords: ProbeCoordinates,
 ) -> None:
     """
     Create contacts for the model.
@@ -170,13 +188,14 @@ def create_contacts(
     Args:
         model: Abaqus Model object
         asm: Assembly object
-        lam_inst: Laminate instance
+        lam_instances: Refined ply instances (one per layer)
         imp_inst: Impactor instance
         cfg: ModelInput configuration object
+        probe_coords: Precomputed findAt probe points
     """
     create_general_contact(model, cfg)
 
-    create_cohesive_layer_contact(model, asm, lam_instances, cfg, stack_layers)
+    create_cohesive_layer_contact(model, asm, lam_instances, cfg, probe_coords)
 
     create_impactor_contact(
         model,
@@ -8,7 +8,8 @@ Handles creation of:
 - Layer stack calculation
 """
 
-from typing import TYPE_CHECKING, List, Tuple
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, List, Optional, Sequence, Tuple
 
 from abaqus import *
 from abaqusConstants import *
@@ -35,6 +36,8 @@ class StackLayer:
         z_top: Z-coordinate of layer top surface
     """
 
+    __slots__ = ("type", "thk", "ang", "z_mid", "z_bot", "z_top")
+
     def __init__(
         self,
         typ: str,
@@ -52,9 +55,64 @@ class StackLayer:
         self.z_top = z_top
 
 
+class LayerStack:
+    """
+    Column-wise (structure-of-arrays) representation of the laminate stack.
+
+    Each attribute is a tuple with one entry per layer, bottom to top, so that
+    consumers needing a single quantity (e.g. all z_mid values) read one column
+    instead of touching every StackLayer object. Indexing and iteration still
+    return StackLayer objects for code that works layer by layer.
+
+    Attributes:
+        type: Layer types ('ply' or 'coh')
+        thk: Layer thicknesses in mm
+        ang: Fiber angles in degrees
+        z_mid: Z-coordinates of layer mid-planes
+        z_bot: Z-coordinates of layer bottom surfaces
+        z_top: Z-coordinates of layer top surfaces
+    """
+
+    __slots__ = ("type", "thk", "ang", "z_mid", "z_bot", "z_top")
+
+    def __init__(
+        self,
+        typ: Sequence[str],
+        thk: Sequence[float],
+        ang: Sequence[float],
+        z_mid: Sequence[float],
+        z_bot: Sequence[float],
+        z_top: Sequence[float],
+    ) -> None:
+        self.type = tuple(typ)
+        self.thk = tuple(thk)
+        self.ang = tuple(ang)
+        self.z_mid = tuple(z_mid)
+        self.z_bot = tuple(z_bot)
+        self.z_top = tuple(z_top)
+
+    def __len__(self) -> int:
+        return len(self.ang)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return StackLayer(
+            self.type[i],
+            self.thk[i],
+            self.ang[i],
+            self.z_mid[i],
+            self.z_bot[i],
+            self.z_top[i],
+        )
+
+    def __iter__(self) -> Iterator[StackLayer]:
+        return (self[i] for i in range(len(self)))
+
+
 def calculate_layer_stack(
     ply_angles: List[int], ply_thk: float, coh_thk: float
-) -> List[StackLayer]:
+) -> LayerStack:
     """
     Calculate the layer stack with positions for all plies and cohesive layers.
 
@@ -64,24 +122,53 @@ def calculate_layer_stack(
         coh_thk: Cohesive layer thickness in mm
 
     Returns:
-        List of StackLayer objects with z-positions calculated
-    """
-    z_bot = 0.0
-    stack_layers = []
-
-    for i, ang in enumerate(ply_angles):
-        stack_layers.append(
-            StackLayer(
-                "ply",
-                ply_thk,
-                float(ang),
-                z_bot + 0.5 * ply_thk,
-                z_bot,
-                z_bot + ply_thk,
-            )
-        )
-        z_bot += ply_thk
-    return stack_layers
+        LayerStack with z-positions calculated
+    """
+    # Positions follow from the ply index directly (no running sum), which keeps
+    # them identical to the partition offsets used in partition_layers
+    n = len(ply_angles)
+    return LayerStack(
+        typ=("ply",) * n,
+        thk=(ply_thk,) * n,
+        ang=[float(ang) for ang in ply_angles],
+        z_mid=[(i + 0.5) * ply_thk for i in range(n)],
+        z_bot=[i * ply_thk for i in range(n)],
+        z_top=[(i + 1) * ply_thk for i in range(n)],
+    )
+
+
+@contextmanager
+def _transient_sketch(
+    model: "Model", name: str, sheet_size: float, created: Optional[List[str]]
+):
+    """
+    Yield a ConstrainedSketch that is only needed to build one part.
+
+    Without a ``created`` list the sketch is deleted on exit. With one, its
+    name is recorded instead and the caller removes all recorded sketches in a
+    single pass (see delete_sketches).
+    """
+    sk = model.ConstrainedSketch(name=name, sheetSize=sheet_size)
+    try:
+        yield sk
+    finally:
+        if created is None:
+            del model.sketches[name]
+        else:
+            created.append(name)
+
+
+def delete_sketches(model: "Model", names: List[str]) -> None:
+    """
+    Delete the sketches recorded while building parts.
+
+    Args:
+        model: Abaqus Model object
+        names: Names of sketches to delete
+    """
+    sketches = model.sketches
+    for name in names:
+        del sketches[name]
 
 
 def make_refined_block(
@@ -91,6 +178,7 @@ def make_refined_block(
     name: str,
     thickness: float,
     angle: float,
+    sketches: Optional[List[str]] = None,
 ) -> "Part":
     """
     Create a rectangular solid part for the refined (impact) zone.
@@ -101,17 +189,18 @@ def make_refined_block(
         plate_L: Plate length in mm
         name: Name for the part
         thickness: Extrusion depth (layer thickness) in mm
+        sketches: Optional list collecting sketch names for deferred deletion
 
     Returns:
         Part object with dimensions plate_W x plate_L x thickness
     """
-    sk = model.ConstrainedSketch(
-        name="sk_" + name, sheetSize=max(plate_W, plate_L) * 10.0
-    )
-    sk.rectangle((-plate_W / 2.0, -plate_L / 2.0), (plate_W / 2.0, plate_L / 2.0))
-    part = model.Part(name=name, dimensionality=THREE_D, type=DEFORMABLE_BODY)
-    part.BaseSolidExtrude(sketch=sk, depth=thickness)
-    del model.sketches["sk_" + name]
+    sheet_size = max(plate_W, plate_L) * 10.0
+    with _transient_sketch(model, "sk_" + name, sheet_size, sketches) as sk:
+        sk.rectangle(
+            (-plate_W / 2.0, -plate_L / 2.0), (plate_W / 2.0, plate_L / 2.0)
+        )
+        part = model.Part(name=name, dimensionality=THREE_D, type=DEFORMABLE_BODY)
+        part.BaseSolidExtrude(sketch=sk, depth=thickness)
     return part
 
 
@@ -122,6 +211,7 @@ def make_outer_coarse_block(
     S: float,
     name: str,
     thickness: float,
+    sketches: Optional[List[str]] = None,
 ) -> "Part":
     """
     Create a frame part for the coarse (outer) zone with rectangular cutout.
@@ -135,49 +225,73 @@ def make_outer_coarse_block(
         plate_L: Plate length in mm
         S: Scale factor for outer dimensions
         name: Name for the part
-        thickness: Extrusion depth (layer thickness) in mm
+        thickness: Extrusion depth in mm
+        sketches: Optional list collecting sketch names for deferred deletion
 
     Returns:
         Part object representing the coarse outer frame
     """
-    sk = model.ConstrainedSketch(
-        name="sk_" + name, sheetSize=max(plate_W, plate_L) * 10.0
-    )
-    sk.rectangle(
-        (-S * plate_W / 2.0, -S * plate_L / 2.0), (S * plate_W / 2.0, S * plate_L / 2.0)
-    )
-    sk.rectangle((-plate_W / 2.0, -plate_L / 2.0), (plate_W / 2.0, plate_L / 2.0))
-    part = model.Part(name=name, dimensionality=THREE_D, type=DEFORMABLE_BODY)
-    part.BaseSolidExtrude(sketch=sk, depth=thickness)
-
-    del model.sketches["sk_" + name]
+    sheet_size = max(plate_W, plate_L) * 10.0
+    with _transient_sketch(model, "sk_" + name, sheet_size, sketches) as sk:
+        sk.rectangle(
+            (-S * plate_W / 2.0, -S * plate_L / 2.0),
+            (S * plate_W / 2.0, S * plate_L / 2.0),
+        )
+        sk.rectangle(
+            (-plate_W / 2.0, -plate_L / 2.0), (plate_W / 2.0, plate_L / 2.0)
+        )
+        part = model.Part(name=name, dimensionality=THREE_D, type=DEFORMABLE_BODY)
+        part.BaseSolidExtrude(sketch=sk, depth=thickness)
     return part
 
 
-def create_impactor(model: "Model", imp_radius: float) -> "Part":
+def partition_layers(part: "Part", ply_thk: float, n_ply: int) -> None:
+    """
+    Split a full-thickness laminate part into one cell per ply.
+
+    Partitions at every ply interface so that each ply keeps its own cell
+    for section and orientation assignment.
+
+    Args:
+        part: Part extruded to the full laminate thickness
+        ply_thk: Ply thickness in mm
+        n_ply: Number of plies in the stack
+    """
+    for i in range(1, n_ply):
+        datum = part.DatumPlaneByPrincipalPlane(
+            principalPlane=XYPLANE, offset=i * ply_thk
+        )
+        part.PartitionCellByDatumPlane(
+            datumPlane=part.datums[datum.id], cells=part.cells
+        )
+
+
+def create_impactor(
+    model: "Model", imp_radius: float, sketches: Optional[List[str]] = None
+) -> "Part":
     """
     Create a rigid hemispherical impactor part.
 
     Args:
         model: Abaqus Model object
         imp_radius: Impactor radius in mm
+        sketches: Optional list collecting sketch names for deferred deletion
 
     Returns:
         Part object for the rigid impactor surface
     """
-    sk = model.ConstrainedSketch(name="sk_imp", sheetSize=imp_radius * 2.0)
-    sk.ConstructionLine(point1=(0.0, -100.0), point2=(0.0, 100.0))
-    sk.ArcByCenterEnds(
-        center=(0.0, imp_radius),
-        point1=(imp_radius, imp_radius),
-        point2=(0.0, 0.0),
-        direction=CLOCKWISE,
-    )
-    imp_part = model.Part(
-        name="Impactor", dimensionality=THREE_D, type=DISCRETE_RIGID_SURFACE
-    )
-    imp_part.BaseShellRevolve(sketch=sk, angle=360.0, flipRevolveDirection=OFF)
-    del model.sketches["sk_imp"]
+    with _transient_sketch(model, "sk_imp", imp_radius * 2.0, sketches) as sk:
+        sk.ConstructionLine(point1=(0.0, -100.0), point2=(0.0, 100.0))
+        sk.ArcByCenterEnds(
+            center=(0.0, imp_radius),
+            point1=(imp_radius, imp_radius),
+            point2=(0.0, 0.0),
+            direction=CLOCKWISE,
+        )
+        imp_part = model.Part(
+            name="Impactor", dimensionality=THREE_D, type=DISCRETE_RIGID_SURFACE
+        )
+        imp_part.BaseShellRevolve(sketch=sk, angle=360.0, flipRevolveDirection=OFF)
     return imp_part
 
 
@@ -198,21 +312,48 @@ def create_geometry(
         (part_ply, part_ply_course, part_coh, part_coh_course, part_impactor)
     """
 
-    # Create a refined block for each unique ply angle
-    unique_angles = list(set(cfg.ply_angles))
+    W, L, ply_thk = cfg.width, cfg.length, cfg.ply_thk
+
+    # Create a refined block for each unique ply angle (in layup order)
+    unique_angles = list(dict.fromkeys(cfg.ply_angles))
 
     # Create a dictionary to hold the parts for each angle
     part_ply = {}
 
+    # Angles 180 deg apart give the same orthotropic orientation, so they share
+    # one part (and one mesh); part_ply still maps every ply angle to its part
+    part_by_orientation = {}
+
+    # Sketches are only needed while extruding; they are removed together below
+    sketches = []
+
+    # The block shape does not depend on the angle: sketch and extrude it once,
+    # then copy it. Each orientation still needs its own part because the
+    # material orientation is assigned on the part.
+    template = None
     for angle in unique_angles:
-        part_name = f"Ply_Angle_{int(angle)}"
-        part_ply[angle] = make_refined_block(
-            model, cfg.width, cfg.length, part_name, cfg.ply_thk, angle
-        )
+        orientation = angle % 180.0
+        part = part_by_orientation.get(orientation)
+        if part is None:
+            part_name = f"Ply_Angle_{int(angle)}"
+            if template is None:
+                part = template = make_refined_block(
+                    model, W, L, part_name, ply_thk, angle, sketches
+                )
+            else:
+                part = model.Part(name=part_name, objectToCopy=template)
+            part_by_orientation[orientation] = part
+        part_ply[angle] = part
+
+    # The coarse frame is identical for every ply: extrude the full stack once
+    # and partition it per ply instead of merging one instance per layer
     part_ply_course = make_outer_coarse_block(
-        model, cfg.width, cfg.length, S, "Ply_Course", cfg.ply_thk
+        model, W, L, S, "Laminate_Course", cfg.plate_T, sketches
     )
+    partition_layers(part_ply_course, ply_thk, cfg.n_ply)
+
+    part_impactor = create_impactor(model, cfg.imp_radius, sketches)
 
-    part_impactor = create_impactor(model, cfg.imp_radius)
+    delete_sketches(model, sketches)
 
     return (part_ply, part_ply_course, part_impactor)
@@ -8,6 +8,7 @@ Handles:
 """
 
 import sys
+import shutil
 import subprocess
 from typing import TYPE_CHECKING, Dict
 import os
@@ -22,6 +23,10 @@ if TYPE_CHECKING:
     from abaqus.Part.Part import Part
     from src.study_generator.model_input import ModelInput
 
+# Abaqus launcher, resolved once so terminating a job needs no shell
+# (None if it is not on PATH)
+ABAQUS_CMD = shutil.which("abaqus")
+
 
 def create_and_submit_job(
     mdb: "Mdb",
@@ -29,6 +34,8 @@ def create_and_submit_job(
     TEMP_DIR: str,
     model_name: str = "Model-1",
     wait: bool = True,
+    num_cpus: int = 1,
+    num_domains: int = 1,
 ) -> None:
     """
     Create and submit Abaqus job with optional progress monitoring.
@@ -38,33 +45,52 @@ def create_and_submit_job(
         job_name: Name for the job
         model_name: Name of the model to use (default "Model-1")
         wait: Whether to wait for job completion (default True)
+        num_cpus: Number of CPUs used by the solver (default 1)
+        num_domains: Number of explicit parallel domains (default 1)
         monitor: Whether to monitor progress in real-time (default True)
         sta_path: Path to .sta file for monitoring (required if monitor=True)
         total_time: Total simulation time for progress calculation (required if monitor=True)
     """
-    # Try numCpus=4 when using project computer resources
-    # Add numCpus and numDomains parameters to cfg and pass them here
     job = mdb.Job(
         name=job_name,
         model=model_name,
         description="Laminate impact with cohesive interlayers (Explicit).",
         explicitPrecision=DOUBLE_PLUS_PACK,
-        numCpus=1,
-        numDomains=1,
+        numCpus=num_cpus,
+        numDomains=num_domains,
     )
 
     job.submit(consistencyChecking=ON)
 
     if wait:
-        # Monitor job status every 10 seconds using python's time module
+        # Follow the .sta file until the job ends or the KE minimum is reached
         sta_path = os.path.join(TEMP_DIR, f"{job_name}.sta")
 
         if monitor_job(sta_path):
             print("\n Job completed successfully by min KE.")
             job.kill()
-            # Do command abaqus terminate job=Job_name through subprocess
-            # subprocess.call(["taskkill", "/F", "/IM", "explicit_dp.exe"])
-            subprocess.call(f"abaqus terminate job={job_name}", cwd=TEMP_DIR, shell=True)
+            _terminate_job(job_name, TEMP_DIR)
+
+
+def _terminate_job(job_name: str, TEMP_DIR: str) -> None:
+    """
+    Run "abaqus terminate" for a job, logging instead of raising on failure.
+
+    Args:
+        job_name: Name of the job to terminate
+        TEMP_DIR: Directory the job runs in
+    """
+    if ABAQUS_CMD is None:
+        log_func(
+            f"Abaqus launcher not found on PATH, skipping terminate of {job_name}."
+        )
+        return
+    try:
+        subprocess.run(
+            [ABAQUS_CMD, "terminate", f"job={job_name}"], cwd=TEMP_DIR, check=False
+        )
+    except OSError as e:
+        log_func(f"Could not terminate {job_name}: {e}")
 
 
 def print_model_report(
@@ -91,65 +117,48 @@ def print_model_report(
 
     nof_plies = cfg.n_ply
 
-    log_section("MODEL REPORT")
-    log_func("\n[Geometry]")
-    log_func(
-        "  Laminate size (mm):   L=%.3f  W=%.3f  T=%.3f"
-        % (cfg.width, cfg.length, cfg.plate_T)
-    )
-    log_func("  Layer thickness (mm):  Ply=%.3f  Coh=%.3f" % (cfg.ply_thk, cfg.coh_thk))
-    log_func(
-        "  Stack:                %d plies, %d cohesive layers" % (cfg.n_ply, cfg.n_coh)
+    # Query each mesh repository once; every ply instance shares one ply mesh
+    n_elements = (
+        len(ply_part.elements) * nof_plies
+        + len(lam_course_part.elements)
+        + len(imp_part.elements)
     )
-    log_func("  Ply angles (deg):     %s" % cfg.ply_angles)
-
-    log_func("\n[Mesh]")
-    log_func(
-        "  Elements:             %d"
-        % (
-            len(ply_part.elements) * nof_plies
-            + len(lam_course_part.elements)
-            + len(imp_part.elements)
-        )
-    )
-    log_func(
-        "  Nodes:                %d"
-        % (
-            len(ply_part.nodes) * nof_plies
-            + len(lam_course_part.nodes)
-            + len(imp_part.nodes)
-        )
+    n_nodes = (
+        len(ply_part.nodes) * nof_plies
+        + len(lam_course_part.nodes)
+        + len(imp_part.nodes)
     )
 
-    log_func(
-        "  Element sizes (mm):   Refined=%.3f  Coarse=%.3f"
-        % (e_size_refined, e_size_global)
-    )
+    mat = cfg.material
 
-    log_func("\n[Impact]")
-    log_func("  Impactor radius (mm): %.3f" % cfg.imp_radius)
-    log_func(
+    # Format the whole report first and write it with a single log call
+    report = [
+        "\n[Geometry]",
+        "  Laminate size (mm):   L=%.3f  W=%.3f  T=%.3f"
+        % (cfg.width, cfg.length, cfg.plate_T),
+        "  Layer thickness (mm):  Ply=%.3f  Coh=%.3f" % (cfg.ply_thk, cfg.coh_thk),
+        "  Stack:                %d plies, %d cohesive layers" % (nof_plies, cfg.n_coh),
+        "  Ply angles (deg):     %s" % cfg.ply_angles,
+        "\n[Mesh]",
+        "  Elements:             %d" % n_elements,
+        "  Nodes:                %d" % n_nodes,
+        "  Element sizes (mm):   Refined=%.3f  Coarse=%.3f"
+        % (e_size_refined, e_size_global),
+        "\n[Impact]",
+        "  Impactor radius (mm): %.3f" % cfg.imp_radius,
         "  Impactor mass:        %.6f ton  (%.1f kg)"
-        % (cfg.imp_mass, cfg.imp_mass * 1000.0)
-    )
-    log_func("  Impactor speed (mm/s):%.1f" % cfg.imp_speed)
-    log_func("  Impact energy (J):    %.2f" % cfg.imp_energy_J)
-
-    log_func("\n[Engineering constants]")
-    log_func(
-        "  E1/E2/E3 (MPa):       %.1f / %.1f / %.1f"
-        % (cfg.material.E1, cfg.material.E2, cfg.material.E3)
-    )
-    log_func(
-        "  nu12/nu23/nu13:       %.2f / %.2f / %.2f"
-        % (cfg.material.NU12, cfg.material.NU23, cfg.material.NU13)
-    )
-    log_func(
-        "  G12/G23/G13 (MPa):    %.1f / %.1f / %.1f"
-        % (cfg.material.G12, cfg.material.G23, cfg.material.G13)
-    )
+        % (cfg.imp_mass, cfg.imp_mass * 1000.0),
+        "  Impactor speed (mm/s):%.1f" % cfg.imp_speed,
+        "  Impact energy (J):    %.2f" % cfg.imp_energy_J,
+        "\n[Engineering constants]",
+        "  E1/E2/E3 (MPa):       %.1f / %.1f / %.1f" % (mat.E1, mat.E2, mat.E3),
+        "  nu12/nu23/nu13:       %.2f / %.2f / %.2f" % (mat.NU12, mat.NU23, mat.NU13),
+        "  G12/G23/G13 (MPa):    %.1f / %.1f / %.1f" % (mat.G12, mat.G23, mat.G13),
+        "\n[Step]",
+        "  Step time (s):        %.6f" % simulation_time,
+        "  Job name:             %s" % cfg.job_name(),
+        "=" * 60,
+    ]
 
-    log_func("\n[Step]")
-    log_func("  Step time (s):        %.6f" % simulation_time)
-    log_func("  Job name:             %s" % cfg.job_name())
-    log_func("=" * 60)
+    log_section("MODEL REPORT")
+    log_func("\n".join(report))
@@ -8,6 +8,7 @@ Handles creation of:
 - Section assignments
 """
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Tuple
 
 from abaqus import *
@@ -51,10 +52,14 @@ def create_lamina_material(
     model.HomogeneousSolidSection(name="LamSec", material="LamMat")
 
 
+@lru_cache(maxsize=1)
 def create_element_types() -> Tuple:
     """
     Create element type definitions for explicit analysis.
 
+    The element types do not depend on the model, so they are created once
+    and reused for every model built in the session.
+
     Returns:
         Tuple of (elem_ply, elem_coh, elem_impactor):
             - elem_ply: C3D8I for composite plies
@@ -79,16 +84,17 @@ def create_materials(model: "Model", cfg: ModelInput) -> None:
     Args:
         cfg: ModelInput object with material properties
     """
+    mat = cfg.material
     create_lamina_material(
         model=model,
-        E1=cfg.material.E1,
-        E2=cfg.material.E2,
-        E3=cfg.material.E3,
-        NU12=cfg.material.NU12,
-        NU13=cfg.material.NU13,
-        NU23=cfg.material.NU23,
-        G12=cfg.material.G12,
-        G13=cfg.material.G13,
-        G23=cfg.material.G23,
-        rho_lam=cfg.material.rho_lam,
+        E1=mat.E1,
+        E2=mat.E2,
+        E3=mat.E3,
+        NU12=mat.NU12,
+        NU13=mat.NU13,
+        NU23=mat.NU23,
+        G12=mat.G12,
+        G13=mat.G13,
+        G23=mat.G23,
+        rho_lam=mat.rho_lam,
     )
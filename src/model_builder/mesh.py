@@ -62,7 +62,8 @@ def seed_and_mesh_model(
     Seed and mesh the laminate parts (refined and coarse).
 
     Args:
-        lam_parts: Dictionary of refined laminate parts keyed by angle
+        lam_parts: Dictionary of refined laminate parts keyed by angle (angles
+            180 deg apart may share a part)
         lam_course_part: Coarse laminate part
         sim_cfg: Simulation configuration object
         cfg: Model configuration object
@@ -71,8 +72,13 @@ def seed_and_mesh_model(
         0.001, float(sim_cfg.mesh_refined) / float(sim_cfg.mesh_coarse)
     )
 
+    # Ply angles 180 deg apart share a part; mesh every part only once
+    meshed = set()
     for part in lam_parts.values():
+        if id(part) in meshed:
+            continue
         seed_and_mesh_laminate(part, sim_cfg.mesh_refined, min_size_factor)
+        meshed.add(id(part))
 
     seed_and_mesh_laminate(lam_course_part, sim_cfg.mesh_coarse, min_size_factor)
     seed_and_mesh_impactor(imp_part, float(cfg.imp_radius))
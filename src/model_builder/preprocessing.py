@@ -7,6 +7,7 @@ Handles:
 - Element type assignments
 """
 
+from bisect import bisect_left
 from typing import TYPE_CHECKING, Dict, List
 
 from abaqus import *
@@ -17,15 +18,41 @@ if TYPE_CHECKING:
     from abaqus.Part.Part import Part
     from abaqus.Mesh.ElemType import ElemType
 
-from src.model_builder.geometry import StackLayer
+from src.model_builder.geometry import LayerStack
 from src.study_generator.model_input import ModelInput
 
 
+def coarse_cells_by_ply(cells, stack_layers: LayerStack) -> List:
+    """
+    Split the cells of the partitioned coarse laminate into one sequence per ply.
+
+    Each cell is matched to a ply by the midpoint z of its own bounding box,
+    which lies strictly between the ply's bottom and top faces, so the cells
+    are visited once instead of querying the part for every ply.
+
+    Args:
+        cells: Cell array of the coarse laminate part
+        stack_layers: LayerStack defining the stack
+
+    Returns:
+        List of cell sequences, in the order of stack_layers
+    """
+    z_top = stack_layers.z_top
+    by_ply = [None] * len(z_top)
+    for k in range(len(cells)):
+        cell = cells[k : k + 1]
+        box = cell.getBoundingBox()
+        z = 0.5 * (box["low"][2] + box["high"][2])
+        ply = min(bisect_left(z_top, z), len(z_top) - 1)
+        by_ply[ply] = cell if by_ply[ply] is None else by_ply[ply] + cell
+    return by_ply
+
+
 def assign_sections_and_orientations(
     lam_parts: Dict[float, "Part"],
     lam_course_part: "Part",
     impactor_part: "Part",
-    stack_layers: List[StackLayer],
+    stack_layers: LayerStack,
     cfg: "ModelInput",
     elem_ply: "ElemType",
     elem_impactor: "ElemType",
@@ -36,7 +63,7 @@ def assign_sections_and_orientations(
     Args:
         lam_part: Refined laminate part
         lam_course_part: Coarse laminate part (can be None)
-        stack_layers: List of StackLayer objects
+        stack_layers: LayerStack defining the stack
         cfg: Model configuration object
         elem_ply: Element type for plies
         elem_coh: Element type for cohesive layers
@@ -48,9 +75,16 @@ def assign_sections_and_orientations(
         regions=(impactor_part.faces,), elemTypes=(elem_impactor,)
     )
 
+    # Ply angles 180 deg apart share a part; orient every part only once
+    assigned = set()
     for angle, part in lam_parts.items():
-        part.setElementType(regions=(part.cells,), elemTypes=(elem_ply,))
-        reg = regionToolset.Region(cells=part.cells)
+        if id(part) in assigned:
+            continue
+        assigned.add(id(part))
+
+        cells = part.cells
+        reg = regionToolset.Region(cells=cells)
+        part.setElementType(regions=(cells,), elemTypes=(elem_ply,))
         part.SectionAssignment(region=reg, sectionName="LamSec")
         part.MaterialOrientation(
             region=reg,
@@ -63,11 +97,23 @@ def assign_sections_and_orientations(
             stackDirection=STACK_ORIENTATION,
         )
 
-    for layer in stack_layers:
-        z_mid = layer.z_mid
+    # Group the coarse ply cells by angle so that each unique angle needs a
+    # single section assignment and material orientation
+    cells_by_angle = {}
+    for cells_course, ang in zip(
+        coarse_cells_by_ply(lam_course_part.cells, stack_layers), stack_layers.ang
+    ):
+        if ang in cells_by_angle:
+            cells_by_angle[ang] = cells_by_angle[ang] + cells_course
+        else:
+            cells_by_angle[ang] = cells_course
+
+    # All coarse cells use the ply element type
+    lam_course_part.setElementType(
+        regions=(lam_course_part.cells,), elemTypes=(elem_ply,)
+    )
 
-        # Find cells in coarse region
-        cells_course = lam_course_part.cells.findAt(((cfg.width, 0, z_mid),))
+    for ang, cells_course in cells_by_angle.items():
         reg_course = regionToolset.Region(cells=cells_course)
 
         lam_course_part.SectionAssignment(region=reg_course, sectionName="LamSec")
@@ -78,7 +124,6 @@ def assign_sections_and_orientations(
             localCsys=None,
             additionalRotationType=ROTATION_ANGLE,
             additionalRotationField="",
-            angle=layer.ang,
+            angle=ang,
             stackDirection=STACK_ORIENTATION,
         )
-        lam_course_part.setElementType(regions=(cells_course,), elemTypes=(elem_ply,))
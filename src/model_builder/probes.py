@@ -0,0 +1,132 @@
+"""
+Geometry probing helpers for composite impact simulations.
+
+Handles:
+- Batched findAt lookups (one kernel call for many points)
+- Splitting batched face lookups back into per-face sequences
+- Probe coordinates for tie, contact and boundary condition setup
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from abaqus.Assembly.PartInstance import PartInstance
+    from src.model_builder.geometry import LayerStack
+
+Point = Tuple[float, float, float]
+
+# Largest z-distance between a face and the level it was probed at (the ACIS
+# tolerance findAt uses)
+_FACE_Z_TOL = 1e-6
+
+
+@dataclass(frozen=True)
+class ProbeCoordinates:
+    """
+    findAt probe points for one model build, computed once from the layer stack.
+
+    Each consumer probes its own set of points; the sets do not overlap, the
+    dataclass only keeps the coordinate maths in one place.
+
+    Attributes:
+        tie_refined: Per ply, the four points on the refined block edges (±X, ±Y)
+        tie_coarse: All tie points of all plies, for one probe of the coarse part
+        clamp: Points on the clamped short edges (±X) of every coarse ply
+        support: Points on the simply supported long edges (±Y) at the bottom
+        interfaces: Z-coordinates of the ply-to-ply (cohesive) interfaces
+    """
+
+    tie_refined: List[List[Point]]
+    tie_coarse: List[Point]
+    clamp: List[Point]
+    support: List[Point]
+    interfaces: List[float]
+
+    @staticmethod
+    def from_stack(
+        stack_layers: "LayerStack", plate_W: float, plate_L: float, S: float
+    ) -> "ProbeCoordinates":
+        """
+        Compute all probe points from the layer stack and plate dimensions.
+
+        Args:
+            stack_layers: LayerStack defining the stack
+            plate_W: Plate width in mm
+            plate_L: Plate length in mm
+            S: Scale factor for coarse region
+
+        Returns:
+            ProbeCoordinates: Probe points for tie, contact and BC setup
+        """
+        tie_refined = [
+            [
+                (plate_W / 2, 0.0, z_mid),
+                (0.0, plate_L / 2, z_mid),
+                (-plate_W / 2, 0.0, z_mid),
+                (0.0, -plate_L / 2, z_mid),
+            ]
+            for z_mid in stack_layers.z_mid
+        ]
+        z_bot = stack_layers.z_bot[0]
+        return ProbeCoordinates(
+            tie_refined=tie_refined,
+            tie_coarse=[p for points in tie_refined for p in points],
+            clamp=[
+                (sign * S * plate_W / 2.0, 0.0, z_mid)
+                for z_mid in stack_layers.z_mid
+                for sign in (1.0, -1.0)
+            ],
+            support=[
+                (0.0, S * plate_L / 2.0, z_bot),
+                (0.0, -S * plate_L / 2.0, z_bot),
+            ],
+            interfaces=list(stack_layers.z_top[:-1]),
+        )
+
+
+def find_at(inst: "PartInstance", points: Sequence[Point], kind: str = "faces"):
+    """
+    Find geometry entities of an instance at several points in one findAt call.
+
+    Args:
+        inst: Part instance to probe
+        points: Sequence of (x, y, z) coordinates
+        kind: Entity repository to probe ("faces" or "edges")
+
+    Returns:
+        Sequence of entities found at the given points
+    """
+    return getattr(inst, kind).findAt(*[(p,) for p in points])
+
+
+def split_faces_by_z(faces, z_values: Sequence[float]) -> List:
+    """
+    Split a batched findAt result into one single-face sequence per z-level.
+
+    Faces are matched by the z-coordinate of their pointOn, so the result does
+    not depend on the order in which findAt returns the faces.
+
+    Args:
+        faces: Face sequence returned by a batched findAt on planar faces
+        z_values: Z-coordinates of the wanted faces
+
+    Returns:
+        List of face sequences (one face each), in the order of z_values
+
+    Raises:
+        ValueError: If findAt did not return one face per z-level, or no face
+            lies at one of the z-levels
+    """
+    if len(faces) != len(z_values):
+        raise ValueError(
+            "findAt returned %d faces for %d z-levels" % (len(faces), len(z_values))
+        )
+    face_z = [face.pointOn[0][2] for face in faces]
+    split = []
+    for z in z_values:
+        k = min(range(len(face_z)), key=lambda j: abs(face_z[j] - z))
+        if abs(face_z[k] - z) > _FACE_Z_TOL:
+            raise ValueError("No face found at z = %g" % z)
+        split.append(faces[k : k + 1])
+    return split
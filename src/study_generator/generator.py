@@ -7,20 +7,34 @@ Generates all combinations automatically.
 
 import json
 import itertools
+import math
 import os
-from typing import Dict, List, Any, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Tuple
 
 from src.study_generator.model_input import ModelInput, MaterialSetup, SimulationConfig
 from src.utils.logger import log_func, log_section
 from src.utils.utils import create_directory
 
 
-def load_study(study_path: str) -> Dict[str, Any]:
-    """Load study configuration from JSON file."""
+@lru_cache(maxsize=8)
+def _load_study_cached(study_path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a study file; cached per (path, modification time)."""
     with open(study_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
+def load_study(study_path: str) -> Dict[str, Any]:
+    """
+    Load study configuration from JSON file.
+
+    The parsed study is cached until the file is modified, so the returned
+    dictionary is shared between callers and must not be mutated.
+    """
+    study_path = os.path.abspath(study_path)
+    return _load_study_cached(study_path, os.path.getmtime(study_path))
+
+
 def load_simulation_config(study_path: str) -> SimulationConfig:
     """
     Load simulation configuration from study file.
@@ -53,27 +67,21 @@ def generate_configs(
     # Load simulation configuration
     sim_config = SimulationConfig.from_dict(study.get("simulation", {}))
 
-    # Extract parameter names and their value lists
-    param_names = []
-    param_values = []
-
-    for name, param_def in study["parameters"].items():
-        param_names.append(name)
-        param_values.append(param_def["values"])
-
     # Generate all combinations
     configs = []
 
-    for i, combo in enumerate(itertools.product(*param_values), start=1):
-        # Create base config dictionary
-        params = dict(zip(param_names, combo))
+    # One MaterialSetup per material name, shared by all configs that use it
+    material_cache: Dict[str, MaterialSetup] = {}
 
+    param_sets = generate_parameter_combinations(study["parameters"])
+    for i, params in enumerate(param_sets, start=1):
         # Get material properties from library
         mat_name = params["material"]
-        mat_props = study["materials"][mat_name]
-
-        # Create MaterialSetup object
-        material = MaterialSetup.from_dict(mat_props)
+        material = material_cache.get(mat_name)
+        if material is None:
+            material = material_cache[mat_name] = MaterialSetup.from_dict(
+                study["materials"][mat_name]
+            )
 
         # Convert imp_mass_kg to tons (Abaqus units)
         imp_mass_ton = params["imp_mass_kg"] / 1000.0
@@ -111,8 +119,10 @@ def create_case_json(
         case_num: Case number (1, 2, 3, ...)
         param_set: Dictionary with parameter values for this case
         study_config: Full study configuration
-        output_dir: Directory where case JSON will be saved
+        output_dir: Existing directory where case JSON will be saved
     """
+    mat_name = param_set.get("material", "MatA")
+
     # Build complete case configuration
     case_config = {
         "case_id": case_num,
@@ -122,39 +132,34 @@ def create_case_json(
         # Include all parameters for this case
         "parameters": param_set,
         # Include material definition
-        "material_name": param_set.get("material", "MatA"),
-        "material_properties": study_config["materials"][
-            param_set.get("material", "MatA")
-        ],
+        "material_name": mat_name,
+        "material_properties": study_config["materials"][mat_name],
         # Include simulation settings
         "simulation": study_config["simulation"],
     }
 
-    # Write to case file
+    # Write to case file; output_dir is created once by split_study_into_cases
     case_filename = "case{}.json".format(case_num)
-    output_dir = os.path.join(output_dir, case_config["created_at"])
     case_path = os.path.join(output_dir, case_filename)
 
-    create_directory(output_dir)
-
     with open(case_path, "w") as f:
         json.dump(case_config, f, indent=2)
 
-    print("Created: {}".format(case_filename))
-
     job_name = f"{study_config['study_name']}_{case_num}"
     return case_path, job_name
 
 
-def generate_parameter_combinations(parameters: dict) -> list[dict]:
+def generate_parameter_combinations(parameters: dict) -> Iterator[dict]:
     """
     Generate all combinations of parameter values.
 
+    Combinations are produced lazily, one parameter set at a time.
+
     Args:
         parameters: Dictionary of parameter names and their values
 
-    Returns:
-        List of dictionaries, each representing one unique parameter set
+    Yields:
+        Dictionary representing one unique parameter set
     """
     # Extract parameter names and their value lists
     param_names = []
@@ -165,14 +170,8 @@ def generate_parameter_combinations(parameters: dict) -> list[dict]:
         param_values.append(param_data["values"])
 
     # Generate all combinations using itertools.product
-    combinations = []
     for combo in itertools.product(*param_values):
-        param_set = {}
-        for name, value in zip(param_names, combo):
-            param_set[name] = value
-        combinations.append(param_set)
-
-    return combinations
+        yield dict(zip(param_names, combo))
 
 
 def split_study_into_cases(
@@ -191,22 +190,31 @@ def split_study_into_cases(
 
     # Generate all parameter combinations
     print("Generating parameter combinations...")
-    combinations = generate_parameter_combinations(study_config["parameters"])
-    print("Found {} unique test cases".format(len(combinations)))
+    parameters = study_config["parameters"]
+    combinations = generate_parameter_combinations(parameters)
+    n_cases = math.prod(len(p["values"]) for p in parameters.values())
+    print("Found {} unique test cases".format(n_cases))
 
-    # Create output directory if it doesn't exist
-    create_directory(output_dir)
+    # Create the output directory for this time stamp once for all cases
+    case_dir = os.path.join(output_dir, time_stamp)
+    create_directory(case_dir)
 
     # Create a JSON file for each case
     print("\nCreating case files...")
     case_files = []
     job_names = []
+    created = []
     for i, param_set in enumerate(combinations, start=1):
         case_path, job_name = create_case_json(
-            i, time_stamp, param_set, study_config, output_dir
+            i, time_stamp, param_set, study_config, case_dir
         )
         case_files.append(case_path)
         job_names.append(job_name)
+        created.append("Created: {}".format(os.path.basename(case_path)))
+
+    # Report all created files with one write instead of one print per case
+    if created:
+        print("\n".join(created))
 
     print("\n" + "=" * 50)
     print("SUCCESS: Created {} case files in {}".format(len(case_files), output_dir))
@@ -215,19 +223,14 @@ def split_study_into_cases(
     return case_files, job_names
 
 
-def from_case_to_model_input(case_path: str) -> ModelInput:
-    """
-    Convert a case JSON file to a ModelInput object.
-
-    Args:
-        case_path: Path to the case JSON file
-
-    Returns:
-        ModelInput object
-    """
+def _load_case(case_path: str) -> Dict[str, Any]:
+    """Load a case JSON file."""
     with open(case_path, "r") as f:
-        case_data = json.load(f)
+        return json.load(f)
 
+
+def _model_input_from_case(case_data: Dict[str, Any]) -> ModelInput:
+    """Build a ModelInput from loaded case data."""
     # Extract material properties
     mat_name = case_data["material_name"]
     mat_props = case_data["material_properties"]
@@ -256,6 +259,24 @@ def from_case_to_model_input(case_path: str) -> ModelInput:
     return model_input
 
 
+def _simulation_config_from_case(case_data: Dict[str, Any]) -> SimulationConfig:
+    """Build a SimulationConfig from loaded case data."""
+    return SimulationConfig.from_dict(case_data.get("simulation", {}))
+
+
+def from_case_to_model_input(case_path: str) -> ModelInput:
+    """
+    Convert a case JSON file to a ModelInput object.
+
+    Args:
+        case_path: Path to the case JSON file
+
+    Returns:
+        ModelInput object
+    """
+    return _model_input_from_case(_load_case(case_path))
+
+
 def from_case_to_simulation_config(case_path: str) -> SimulationConfig:
     """
     Extract SimulationConfig from a case JSON file.
@@ -266,46 +287,51 @@ def from_case_to_simulation_config(case_path: str) -> SimulationConfig:
     Returns:
         SimulationConfig object
     """
-    with open(case_path, "r") as f:
-        case_data = json.load(f)
-
-    sim_dict = case_data.get("simulation", {})
-    return SimulationConfig.from_dict(sim_dict)
+    return _simulation_config_from_case(_load_case(case_path))
 
 
 def from_case_to_configs(case_path: str) -> Tuple[ModelInput, SimulationConfig]:
     """
     Convert a case JSON file to ModelInput and SimulationConfig objects.
 
+    The file is read and parsed once for both objects.
+
     Args:
         case_path: Path to the case JSON file
 
     Returns:
         Tuple of ModelInput and SimulationConfig objects
     """
-    model_input = from_case_to_model_input(case_path)
-    simulation_config = from_case_to_simulation_config(case_path)
-    return model_input, simulation_config
+    case_data = _load_case(case_path)
+    return _model_input_from_case(case_data), _simulation_config_from_case(case_data)
 
 
 def print_study_summary(study_path: str, time_stamp: str) -> None:
-    configs = generate_configs(study_path, time_stamp)[0]
+    study = load_study(study_path)
+    parameters = study["parameters"]
+
+    # Every combination of the parameter lists is one configuration
+    n_configs = math.prod(len(p["values"]) for p in parameters.values())
 
     log_section("PARAMETRIC STUDY SUMMARY")
-    log_func(f"Total configurations: {len(configs)}")
+    log_func(f"Total configurations: {n_configs}")
+
+    if n_configs:
+        log_func(f"\nStudy: {study['study_name']}")
+        log_func(f"Units: {study['units']}")
 
-    if configs:
-        first = configs[0]
-        log_func(f"\nStudy: {first.study}")
-        log_func(f"Units: {first.units}")
+        def unique_count(name: str) -> int:
+            # Layups are lists; count them as tuples so they can be hashed
+            values = parameters[name]["values"]
+            return len(set(tuple(v) if isinstance(v, list) else v for v in values))
 
         variations = {
-            "ply_angles": len(set(str(c.ply_angles) for c in configs)),
-            "ply_thk": len(set(c.ply_thk for c in configs)),
-            "material": len(set(c.material_name for c in configs)),
-            "imp_speed": len(set(c.imp_speed for c in configs)),
-            "imp_mass": len(set(c.imp_mass for c in configs)),
-            "imp_radius": len(set(c.imp_radius for c in configs)),
+            "ply_angles": unique_count("ply_angles"),
+            "ply_thk": unique_count("ply_thk"),
+            "material": unique_count("material"),
+            "imp_speed": unique_count("imp_speed"),
+            "imp_mass": unique_count("imp_mass_kg"),
+            "imp_radius": unique_count("imp_radius"),
         }
 
         log_func("\nParameter variations:")
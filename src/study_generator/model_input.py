@@ -9,12 +9,25 @@ Defines immutable dataclasses for:
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Any
 import os
 
-
-@dataclass(frozen=True)
+# (name, type, default) of every SimulationConfig field; the default is used
+# when the key is missing from the "simulation" section
+_SIMULATION_FIELDS = (
+    ("time", float, 0.008),
+    ("mesh_refined", float, 1.0),
+    ("mesh_coarse", float, 2.0),
+    ("coarse_scale", float, 2.0),
+    ("num_output_intervals", int, 250),
+    ("max_parallel_jobs", int, 1),
+    ("num_cpus", int, 1),
+    ("num_domains", int, 1),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
     """
     Simulation parameters for mesh sizing, time steps, and post-processing.
@@ -25,6 +38,9 @@ class SimulationConfig:
         mesh_coarse: Element size for coarse (outer) region in mm
         coarse_scale: Scale factor for coarse region size (default 2.0)
         num_output_intervals: Number of field output intervals (default 250)
+        max_parallel_jobs: Maximum number of cases solved at the same time (default 1)
+        num_cpus: CPUs used by each Abaqus job (default 1)
+        num_domains: Explicit parallel domains per job (default 1)
     """
 
     time: float
@@ -32,6 +48,22 @@ class SimulationConfig:
     mesh_coarse: float
     coarse_scale: float = 2.0
     num_output_intervals: int = 250
+    max_parallel_jobs: int = 1
+    num_cpus: int = 1
+    num_domains: int = 1
+
+    def __post_init__(self) -> None:
+        for name in ("max_parallel_jobs", "num_cpus", "num_domains"):
+            if getattr(self, name) < 1:
+                raise ValueError(
+                    "%s must be at least 1, got %d" % (name, getattr(self, name))
+                )
+        # Abaqus/Explicit requires the domain count to be a multiple of the CPUs
+        if self.num_domains % self.num_cpus != 0:
+            raise ValueError(
+                "num_domains (%d) must be a multiple of num_cpus (%d)"
+                % (self.num_domains, self.num_cpus)
+            )
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "SimulationConfig":
@@ -44,16 +76,16 @@ class SimulationConfig:
         Returns:
             SimulationConfig: Initialized simulation configuration
         """
+        get = d.get
         return SimulationConfig(
-            time=float(d.get("time", 0.008)),
-            mesh_refined=float(d.get("mesh_refined", 1)),
-            mesh_coarse=float(d.get("mesh_coarse", 2)),
-            coarse_scale=float(d.get("coarse_scale", 2.0)),
-            num_output_intervals=int(d.get("num_output_intervals", 250)),
+            **{
+                name: conv(get(name, default))
+                for name, conv, default in _SIMULATION_FIELDS
+            }
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MaterialSetup:
     """
     Material properties for lamina (ply) and cohesive interface layers.
@@ -108,32 +140,14 @@ class MaterialSetup:
         Returns:
             MaterialSetup: Initialized material properties object
         """
-        return MaterialSetup(
-            E1=d["E1"],
-            E2=d["E2"],
-            E3=d["E3"],
-            NU12=d["NU12"],
-            NU13=d["NU13"],
-            NU23=d["NU23"],
-            G12=d["G12"],
-            G13=d["G13"],
-            G23=d["G23"],
-            rho_lam=d["rho_lam"],
-            En=d["En"],
-            G1=d["G1"],
-            G2=d["G2"],
-            N=d["N"],
-            S1=d["S1"],
-            S2=d["S2"],
-            eta=d["eta"],
-            GIc=d["GIc"],
-            GIIc=d["GIIc"],
-            GIIIc=d["GIIIc"],
-            rho_coh=d["rho_coh"],
-        )
+        return MaterialSetup(*[d[name] for name in _MATERIAL_FIELDS])
+
+
+# Field names of MaterialSetup, in declaration order
+_MATERIAL_FIELDS = tuple(f.name for f in fields(MaterialSetup))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelInput:
     """
     Complete configuration for a single composite impact simulation.
@@ -176,10 +190,28 @@ class ModelInput:
     material_name: str
     material: MaterialSetup
 
+    # Derived values; the instance is frozen, so they are computed once
+    _n_ply: int = field(init=False, repr=False, compare=False)
+    _n_coh: int = field(init=False, repr=False, compare=False)
+    _plate_T: float = field(init=False, repr=False, compare=False)
+    _imp_energy_J: float = field(init=False, repr=False, compare=False)
+    _job_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        ang = self.ply_angles
+        n_ply = len(ang)
+        m_kg = self.imp_mass * 1000.0
+        v_m_s = self.imp_speed / 1000.0
+        object.__setattr__(self, "_n_ply", n_ply)
+        object.__setattr__(self, "_n_coh", sum(a != b for a, b in zip(ang, ang[1:])))
+        object.__setattr__(self, "_plate_T", n_ply * self.ply_thk)
+        object.__setattr__(self, "_imp_energy_J", 0.5 * m_kg * v_m_s * v_m_s)
+        object.__setattr__(self, "_job_name", f"{self.study}_{self.uid}")
+
     @property
     def n_ply(self) -> int:
         """Number of plies in the layup."""
-        return len(self.ply_angles)
+        return self._n_ply
 
     @property
     def n_coh(self) -> int:
@@ -189,20 +221,17 @@ class ModelInput:
         Cohesive layers are inserted between adjacent plies that have different
         fiber orientations to capture delamination.
         """
-        ang = self.ply_angles
-        return sum(1 for i in range(len(ang) - 1) if ang[i] != ang[i + 1])
+        return self._n_coh
 
     @property
     def plate_T(self) -> float:
         """Total plate thickness in mm (plies + cohesive layers)."""
-        return self.n_ply * self.ply_thk
+        return self._plate_T
 
     @property
     def imp_energy_J(self) -> float:
         """Impact kinetic energy in Joules (0.5 * m * v²)."""
-        m_kg = self.imp_mass * 1000.0
-        v_m_s = self.imp_speed / 1000.0
-        return 0.5 * m_kg * v_m_s * v_m_s
+        return self._imp_energy_J
 
     def job_name(self) -> str:
         """
@@ -211,7 +240,7 @@ class ModelInput:
         Returns:
             Job name string in format: {study}_{uid}
         """
-        return f"{self.study}_{self.uid}"
+        return self._job_name
 
     def create_txt_summary(self, filepath: str) -> None:
         """
@@ -221,24 +250,25 @@ class ModelInput:
             filepath: Path where the summary text file will be written
         """
         txt_file = os.path.join(filepath, "config_summary.txt")
-        with open(txt_file, "w") as f:
-            f.write("Job Summary\n")
-            f.write("===========\n")
-            f.write(f"Job Name: {self.job_name()}\n")
-
-            f.write("\nPlate Data:\n")
-            f.write("===========\n")
-            f.write(f"Ply Angles: {self.ply_angles}\n")
-            f.write(f"Ply Thickness (mm): {self.ply_thk:.3f}\n")
-            f.write(f"Cohesive Thickness (mm): {self.coh_thk:.3f}\n")
-            f.write(f"Number of Plies: {self.n_ply}\n")
-            f.write(f"Number of Cohesive Layers: {self.n_coh}\n")
-            f.write(f"Plate Thickness (mm): {self.plate_T:.3f}\n")
-
-            f.write("\nImpactor Data:\n")
-            f.write("===========\n")
-            f.write(f"Impact Radius (mm): {self.imp_radius:.1f}\n")
-            f.write(f"Impact Mass (kg): {self.imp_mass * 1e3:.3f}\n")
-            f.write(f"Impact Speed (m/s): {self.imp_speed * 1e-3:.1f}\n")
-            f.write(f"Impact Energy (J): {self.imp_energy_J:.1f}\n")
+        summary = (
+            "Job Summary\n"
+            "===========\n"
+            f"Job Name: {self.job_name()}\n"
+            "\nPlate Data:\n"
+            "===========\n"
+            f"Ply Angles: {self.ply_angles}\n"
+            f"Ply Thickness (mm): {self.ply_thk:.3f}\n"
+            f"Cohesive Thickness (mm): {self.coh_thk:.3f}\n"
+            f"Number of Plies: {self.n_ply}\n"
+            f"Number of Cohesive Layers: {self.n_coh}\n"
+            f"Plate Thickness (mm): {self.plate_T:.3f}\n"
+            "\nImpactor Data:\n"
+            "===========\n"
+            f"Impact Radius (mm): {self.imp_radius:.1f}\n"
+            f"Impact Mass (kg): {self.imp_mass * 1e3:.3f}\n"
+            f"Impact Speed (m/s): {self.imp_speed * 1e-3:.1f}\n"
+            f"Impact Energy (J): {self.imp_energy_J:.1f}\n"
             # TODO: add more details as needed
+        )
+        with open(txt_file, "w") as f:
+            f.write(summary)
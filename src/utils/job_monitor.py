@@ -1,48 +1,71 @@
+import os
+import re
+import math
 import time
+from collections import namedtuple
 
 from src.utils.logger import log_func, log_section
 
+# How often the .sta file is checked for changes (seconds)
+_POLL_INTERVAL = 0.5
+# Re-read the .sta file at least this often, even if no change was seen (seconds)
+_MAX_WAIT = 5.0
 
-def _find_solution_progress_section(lines: list[str]) -> int:
-    """Find the index of the SOLUTION PROGRESS section."""
-    for i, line in enumerate(lines):
-        if "SOLUTION PROGRESS" in line:
-            return i
-    return -1
 
+def _sta_signature(sta_path: str) -> tuple:
+    """Return (inode, size, mtime) of the .sta file, or None if it does not exist."""
+    try:
+        st = os.stat(sta_path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
 
-def _is_header_line(line: str) -> bool:
-    """Check if line is an unwanted header line."""
-    return (
-        (line.startswith("STEP") and "ORIGIN" in line)
-        or (line.startswith("STEP") and "TOTAL" in line and "WALL" in line)
-        or (line.startswith("INCREMENT") and "TIME" in line)
-    )
-
-
-def _is_increment_data_line(line: str) -> bool:
-    """Check if line contains increment data."""
-    return line and line[0].isdigit() and "E+" in line and "E-" in line
 
+def _wait_for_update(sta_path: str, last_signature: tuple) -> tuple:
+    """Block until the .sta file changes or _MAX_WAIT seconds have passed.
 
-def _should_skip_line(line: str) -> bool:
-    """Check if line should be skipped from output."""
-    return line.startswith("INSTANCE WITH CRITICAL") or line.startswith(
-        "Output Field Frame"
-    )
-
+    Only a stat call is made per check, so the file is parsed as soon as Abaqus
+    appends to it instead of after a fixed sleep.
 
-def _parse_increment_data(values: list[str]) -> dict:
+    Returns:
+        tuple: Signature of the file when the wait ended
+    """
+    deadline = time.monotonic() + _MAX_WAIT
+    while True:
+        signature = _sta_signature(sta_path)
+        if signature != last_signature or time.monotonic() >= deadline:
+            return signature
+        time.sleep(_POLL_INTERVAL)
+
+
+# One parsed increment row of the .sta file
+IncData = namedtuple(
+    "IncData",
+    "increment step_time total_time wall_time stable_inc kinetic_energy total_energy",
+)
+
+# Table headers repeated by Abaqus ("STEP ... ORIGIN", "STEP TOTAL WALL ...",
+# "INCREMENT ... TIME ...")
+_HEADER_RE = re.compile(
+    r"STEP(?=.*ORIGIN)|STEP(?=.*TOTAL)(?=.*WALL)|INCREMENT(?=.*TIME)"
+)
+# Increment rows start with the increment number and hold E+/E- floats
+_DATA_RE = re.compile(r"\d(?=.*E\+)(?=.*E-)")
+# Informational lines that are not logged
+_SKIP_RE = re.compile(r"INSTANCE WITH CRITICAL|Output Field Frame")
+
+
+def _parse_increment_data(values: list[str]) -> IncData:
     """Parse increment data from split line values."""
-    return {
-        "increment": int(values[0]),
-        "step_time": float(values[1]),
-        "total_time": float(values[2]),
-        "wall_time": values[3],
-        "stable_inc": float(values[4]),
-        "kinetic_energy": float(values[6]),
-        "total_energy": float(values[7]),
-    }
+    return IncData(
+        int(values[0]),
+        float(values[1]),
+        float(values[2]),
+        values[3],
+        float(values[4]),
+        float(values[6]),
+        float(values[7]),
+    )
 
 
 def _print_header():
@@ -52,42 +75,61 @@ def _print_header():
     )
 
 
-def _print_increment_data(data: dict):
+def _print_increment_data(data: IncData):
     """Print formatted increment data."""
     log_func(
-        f"{data['increment']:<8} {data['step_time']:<12.4e} {data['wall_time']:<10} "
-        f"{data['stable_inc']:<12.4e} {data['kinetic_energy']:<10.3e} {data['total_energy']:<10.3e}"
+        f"{data.increment:<8} {data.step_time:<12.4e} {data.wall_time:<10} "
+        f"{data.stable_inc:<12.4e} {data.kinetic_energy:<10.3e} {data.total_energy:<10.3e}"
     )
 
 
-def _check_ke_minimum(
-    kinetic_energy: float, previous_ke: float, min_ke: float, ke_increasing_count: int
-) -> tuple[float, int, bool]:
-    """Check if kinetic energy has reached minimum and started increasing.
+class KETracker:
+    """Detect when the kinetic energy has passed its minimum.
 
-    Returns:
-        tuple: (updated min_ke, updated ke_increasing_count, should_exit)
+    The analysis is considered finished once the kinetic energy has increased
+    for ``rising_limit`` consecutive increments after its lowest value so far.
+    The first increment only serves as the reference for the second one and is
+    never taken as the minimum.
     """
-    if previous_ke is None:
-        return min_ke, ke_increasing_count, False
-
-    # Update minimum KE if current is lower
-    if min_ke is None or kinetic_energy < min_ke:
-        return kinetic_energy, 0, False
 
-    # Check if KE is increasing after minimum
-    if kinetic_energy > previous_ke:
-        ke_increasing_count += 1
-        if ke_increasing_count >= 3:
-            log_func(
-                f"\n Kinetic energy is increasing (min: {min_ke:.3e}, current: {kinetic_energy:.3e})"
-            )
-            log_func("Stopping analysis - minimum energy state reached.")
-            return min_ke, ke_increasing_count, True
-    else:
-        ke_increasing_count = 0
-
-    return min_ke, ke_increasing_count, False
+    __slots__ = ("min_ke", "prev_ke", "rising_count", "rising_limit")
+
+    def __init__(self, rising_limit: int = 3):
+        self.min_ke = math.inf
+        self.prev_ke = None
+        self.rising_count = 0
+        self.rising_limit = rising_limit
+
+    def update(self, kinetic_energy: float) -> bool:
+        """Record the kinetic energy of the next increment.
+
+        Returns:
+            bool: True if the minimum has been reached and the analysis can stop
+        """
+        if self.prev_ke is None:
+            # First increment: only record it
+            self.prev_ke = kinetic_energy
+            return False
+
+        should_exit = False
+        if kinetic_energy < self.min_ke:
+            # New minimum
+            self.min_ke = kinetic_energy
+            self.rising_count = 0
+        elif kinetic_energy > self.prev_ke:
+            # Increasing after the minimum
+            self.rising_count += 1
+            if self.rising_count >= self.rising_limit:
+                log_func(
+                    f"\n Kinetic energy is increasing (min: {self.min_ke:.3e}, "
+                    f"current: {kinetic_energy:.3e})"
+                )
+                log_func("Stopping analysis - minimum energy state reached.")
+                should_exit = True
+        else:
+            self.rising_count = 0
+        self.prev_ke = kinetic_energy
+        return should_exit
 
 
 def _check_completion_status(line: str) -> tuple[bool, bool]:
@@ -108,48 +150,96 @@ def _check_completion_status(line: str) -> tuple[bool, bool]:
 def monitor_job(sta_path: str) -> bool:
     """Monitor the status of an Abaqus job until completion.
 
+    The .sta file is kept open and only the text appended since the previous
+    read is parsed, so each line is processed exactly once. If the file is
+    replaced or truncated (e.g. a rerun of the same job), it is reopened and
+    parsed from the start.
+
     Args:
         sta_path: Path to the .sta file of the job to monitor
 
     Returns:
         bool: True if job completed successfully, False otherwise
     """
-    last_printed_line_index = -1
     header_printed = False
-    previous_ke = None
-    min_ke = None
-    ke_increasing_count = 0
 
     time.sleep(5)  # Initial wait for file creation
 
-    while True:
-        try:
-            with open(sta_path, "r") as sta_file:
-                lines = sta_file.readlines()
-
-            solution_progress_index = _find_solution_progress_section(lines)
-
-            if solution_progress_index >= 0:
-                start_index = solution_progress_index + 2
+    # Bound pattern matchers for the per-line loop
+    is_header = _HEADER_RE.match
+    is_data = _DATA_RE.match
+    is_skipped = _SKIP_RE.match
+
+    sta_file = None
+    try:
+        while True:
+            if sta_file is None:
+                try:
+                    # Binary mode, so tell() is the number of bytes consumed
+                    sta_file = open(sta_path, "rb")
+                except FileNotFoundError:
+                    log_func(
+                        f"Status file not found: {sta_path}. "
+                        "Waiting for file to be created..."
+                    )
+                    time.sleep(5)
+                    continue
+
+                sta_inode = os.fstat(sta_file.fileno()).st_ino
+                ke_tracker = KETracker()
+                # Lines are only reported once the SOLUTION PROGRESS section
+                # has started; the line right after the section title is
+                # skipped as well
+                in_progress = False
+                lines_to_skip = 0
+                # Incomplete last line of the previous read
+                pending = ""
+
+            signature = _sta_signature(sta_path)
+            if (
+                signature is None
+                or signature[0] != sta_inode
+                or signature[1] < sta_file.tell()
+            ):
+                # File deleted, replaced or truncated: start over on the new one
+                log_func(f"Status file {sta_path} was replaced, reopening it.")
+                sta_file.close()
+                sta_file = None
+                continue
+
+            new_text = sta_file.read().decode("latin-1")
+
+            if new_text:
+                lines = (pending + new_text).split("\n")
+                pending = lines.pop()
+
+                for raw_line in lines:
+                    if not in_progress:
+                        if "SOLUTION PROGRESS" in raw_line:
+                            in_progress = True
+                            lines_to_skip = 1
+                        continue
+                    if lines_to_skip:
+                        lines_to_skip -= 1
+                        continue
 
-                for i in range(
-                    max(start_index, last_printed_line_index + 1), len(lines)
-                ):
-                    line = lines[i].strip()
+                    line = raw_line.strip()
 
-                    # Check for completion or errors
-                    has_status, success = _check_completion_status(line)
-                    if has_status:
-                        return success
+                    # Check for completion or errors; every status line
+                    # mentions ANALYSIS, so most lines skip the call
+                    if "ANALYSIS" in line:
+                        has_status, success = _check_completion_status(line)
+                        if has_status:
+                            return success
 
                     # Skip header lines
-                    if _is_header_line(line):
-                        last_printed_line_index = i
+                    if is_header(line):
                         continue
 
                     # Parse and print increment data
-                    if _is_increment_data_line(line):
-                        values = line.split()
+                    if is_data(line):
+                        # Only the first 8 columns are used; stop splitting after them
+                        values = line.split(None, 8)
                         if len(values) >= 7:
                             try:
                                 data = _parse_increment_data(values)
@@ -161,32 +251,16 @@ def monitor_job(sta_path: str) -> bool:
                                 _print_increment_data(data)
 
                                 # Check for KE minimum
-                                min_ke, ke_increasing_count, should_exit = (
-                                    _check_ke_minimum(
-                                        data["kinetic_energy"],
-                                        previous_ke,
-                                        min_ke,
-                                        ke_increasing_count,
-                                    )
-                                )
-                                if should_exit:
+                                if ke_tracker.update(data.kinetic_energy):
                                     return True
 
-                                previous_ke = data["kinetic_energy"]
-
                             except (ValueError, IndexError):
                                 if line:
                                     log_func(line)
-                    elif line and not _should_skip_line(line):
+                    elif line and not is_skipped(line):
                         log_func(line)
 
-                    last_printed_line_index = i
-
-        except FileNotFoundError:
-            log_func(
-                f"Status file not found: {sta_path}. Waiting for file to be created..."
-            )
-            time.sleep(5)
-            continue
-
-        time.sleep(5)
+            _wait_for_update(sta_path, signature)
+    finally:
+        if sta_file is not None:
+            sta_file.close()
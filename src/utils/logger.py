@@ -5,8 +5,12 @@ Provides a clean way to log messages to a file instead of the Abaqus terminal.
 """
 
 import os
+import atexit
 from datetime import datetime
 
+# Format of the start and end timestamps in the log header and footer
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 
 class Logger:
     """
@@ -18,21 +22,25 @@ class Logger:
         logger.close()
     """
 
-    def __init__(self, log_dir, log_filename="log.txt"):
+    def __init__(self, log_dir, log_filename="log.txt", flush_every=64):
         """
         Initialize logger with log file path.
 
         Args:
             log_dir: Directory where log file will be created
             log_filename: Name of the log file (default: "log.txt")
+            flush_every: Flush the file after this many messages (default: 64)
         """
         self.log_path = os.path.join(log_dir, log_filename)
         self.file = open(self.log_path, "w")
+        self._write = self.file.write
+        self.flush_every = flush_every
+        self._unflushed = 0
 
         # Write header
         self.log("=" * 70)
         self.log("SIMULATION LOG")
-        self.log("Started: %s" % datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        self.log("Started: %s" % datetime.now().strftime(_TIME_FORMAT))
         self.log("=" * 70)
         self.log("")
 
@@ -43,8 +51,15 @@ class Logger:
         Args:
             message: Message string to log
         """
-        self.file.write("%s\n" % (message))
-        self.file.flush()  # Ensure immediate write
+        self._write(f"{message}\n")
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Write buffered messages to disk."""
+        self.file.flush()
+        self._unflushed = 0
 
     def section(self, title):
         """
@@ -57,23 +72,38 @@ class Logger:
         self.log("=" * 70)
         self.log(title)
         self.log("=" * 70)
+        self.flush()
 
     def close(self):
         """Close the log file."""
         if self.file and not self.file.closed:
             self.log("")
             self.log("=" * 70)
-            self.log("Log ended: %s" % datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            self.log("Log ended: %s" % datetime.now().strftime(_TIME_FORMAT))
             self.log("=" * 70)
             self.file.close()
 
-    def __del__(self):
-        """Ensure file is closed on deletion."""
-        self.close()
 
+class _NullLogger:
+    """Stand-in used while no log file is open; discards all messages."""
+
+    def log(self, message):
+        pass
+
+    def section(self, title):
+        pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+_NULL_LOGGER = _NullLogger()
 
 # Global logger instance
-_logger = None
+_logger = _NULL_LOGGER
 
 
 def init_logger(log_dir, log_filename="log.txt"):
@@ -85,8 +115,7 @@ def init_logger(log_dir, log_filename="log.txt"):
         log_filename: Name of the log file (default: "log.txt")
     """
     global _logger
-    if _logger is not None:
-        _logger.close()
+    _logger.close()
     _logger = Logger(log_dir, log_filename)
 
 
@@ -97,8 +126,7 @@ def log_func(message):
     Args:
         message: Message to log
     """
-    if _logger is not None:
-        _logger.log(message)
+    _logger.log(message)
 
 
 def log_section(title):
@@ -108,13 +136,15 @@ def log_section(title):
     Args:
         title: Section title
     """
-    if _logger is not None:
-        _logger.section(title)
+    _logger.section(title)
 
 
 def close_logger():
     """Close the global logger."""
     global _logger
-    if _logger is not None:
-        _logger.close()
-        _logger = None
+    _logger.close()
+    _logger = _NULL_LOGGER
+
+
+# Write out buffered messages if the process exits without close_logger()
+atexit.register(close_logger)
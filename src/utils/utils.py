@@ -5,21 +5,26 @@ from src.utils.logger import log_func
 
 def create_directory(path: str):
     """Create output directory if it does not exist."""
-    if not os.path.exists(path):
-        os.makedirs(path)
+    os.makedirs(path, exist_ok=True)
+
+
+def _log_delete_error(func, path, exc_info):
+    """rmtree error handler: log the failure and continue with the rest."""
+    log_func(f"Warning: Failed to delete {path}: {exc_info[1]}")
 
 
 def clean_directory(directory_path):
     """Remove all contents of a directory."""
-    for item in os.listdir(directory_path):
-        item_path = os.path.join(directory_path, item)
-        try:
-            if os.path.isfile(item_path):
-                os.unlink(item_path)
-            elif os.path.isdir(item_path):
-                shutil.rmtree(item_path)
-        except Exception as e:
-            log_func(f"Warning: Failed to delete {item_path}: {e}")
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            # Symlinks are removed themselves, never followed
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, onerror=_log_delete_error)
+            else:
+                try:
+                    os.unlink(entry.path)
+                except OSError as e:
+                    log_func(f"Warning: Failed to delete {entry.path}: {e}")
 
 
 def remove_file(directory_path, file_name):
@@ -34,8 +39,5 @@ def remove_file(directory_path, file_name):
 
 def remove_directory(directory_path):
     """Remove an entire directory including the folder itself."""
-    try:
-        if os.path.isdir(directory_path):
-            shutil.rmtree(directory_path)
-    except Exception as e:
-        log_func(f"Warning: Failed to delete directory {directory_path}: {e}")
+    if os.path.isdir(directory_path):
+        shutil.rmtree(directory_path, onerror=_log_delete_error)